@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
+import importlib
+
 from .negotiation import Response
 from .constants import APP_KEY, CONFIG_KEY
-from .runner import run
 
 __version__ = '3.2.1'
 __author__ = 'Steven Loria'
@@ -13,3 +14,15 @@ __all__ = (
     'APP_KEY',
     'CONFIG_KEY',
 )
+
+
+def __getattr__(name):
+    # The runner imports gunicorn, so only load it when it is actually used
+    if name == 'runner':
+        # Importing the submodule also binds it on the package
+        return importlib.import_module('.runner', __name__)
+    if name == 'run':
+        from .runner import run
+        globals()['run'] = run
+        return run
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
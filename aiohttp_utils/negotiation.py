@@ -78,18 +78,19 @@ with a corresponding media type.
 
 .. code-block:: python
 
-    from collections import OrderedDict
     from aiohttp_utils import negotiation
 
-    negotiation.setup(app, renderers=OrderedDict([
-        ('text/plain', render_text),
-        ('application/json', negotiation.render_json),
-    ]))
+    negotiation.setup(app, renderers={
+        'text/plain': render_text,
+        'application/json': negotiation.render_json,
+    })
 
 .. note::
 
-    We use an `OrderedDict <collections.OrderedDict>` of renderers because priority is given to
-    the first specified renderer when the client passes an unsupported media type.
+    The order of renderers matters: priority is given to the first specified
+    renderer when the client passes an unsupported media type. Dictionaries
+    preserve insertion order, so a plain `dict` (or an
+    `OrderedDict <collections.OrderedDict>`) may be used.
 
 By default, rendering the value returned by a handler according to content
 negotiation will only occur if this value is considered True. If you want to
@@ -98,20 +99,30 @@ value you can set the `force_rendering` flag:
 
 .. code-block:: python
 
-    from collections import OrderedDict
     from aiohttp_utils import negotiation
 
-    negotiation.setup(app, force_rendering=True,
-                      renderers=OrderedDict([
-        ('application/json', negotiation.render_json),
-    ]))
+    negotiation.setup(app, force_rendering=True, renderers={
+        'application/json': negotiation.render_json,
+    })
+
+Rendering large payloads can block the event loop. If you set
+``async_render_threshold``, data whose length (``len(data)``) exceeds the
+threshold is rendered in the loop's default executor. This only applies to
+non-coroutine renderers, which must then be thread-safe.
+
+.. code-block:: python
+
+    from aiohttp_utils import negotiation
+
+    negotiation.setup(app, async_render_threshold=1000)
 
 """
-from collections import OrderedDict
+from collections.abc import Mapping, Sized
 import asyncio
+import functools
 import json as pyjson
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mimeparse
 
 from .constants import CONFIG_KEY
@@ -132,6 +143,7 @@ class Response(web.Response):
     which is the data to be negotiated by the
     `negotiation_middleware <aiohttp_utils.negotiation.negotiation_middleware>`.
     """
+    __slots__ = ('data', )
 
     def __init__(self, data=None, *args, **kwargs):
         if data is not None and kwargs.get('body', None):
@@ -144,35 +156,123 @@ class Response(web.Response):
 
 # ##### Negotiation strategies #####
 
-def select_renderer(request: web.Request, renderers: OrderedDict, force=True):
+# Maximum number of distinct Accept headers for which the default negotiator
+# remembers its selection
+_SELECTOR_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=1024)
+def _best_match(header: str, media_types: tuple):
+    # Clients tend to send the same handful of Accept headers, so memoize
+    # mimeparse's parsing and ranking. Keyed on the media types (rather than
+    # the renderers dict) so that reconfiguring renderers never hits a stale entry.
+    return mimeparse.best_match(media_types, header)
+
+
+def select_renderer(request: web.Request, renderers: Mapping, force=True):
     """
     Given a request, a list of renderers, and the ``force`` configuration
     option, return a two-tuple of:
     (media type, render callable). Uses mimeparse to find the best media
     type match from the ACCEPT header.
     """
-    header = request.headers.get('ACCEPT', '*/*')
-    best_match = mimeparse.best_match(renderers.keys(), header)
+    header = request.headers.get(hdrs.ACCEPT, '*/*')
+    best_match = _best_match(header, tuple(renderers))
     if not best_match or best_match not in renderers:
         if force:
-            return tuple(renderers.items())[0]
+            return next(iter(renderers.items()))
         else:
             raise web.HTTPNotAcceptable
     return best_match, renderers[best_match]
 
 
+def _make_renderer_selector(renderers: Mapping, force: bool):
+    """Specialize `select_renderer` for a fixed mapping of renderers. Everything
+    that only depends on the renderers is computed once rather than per request.
+    """
+    renderers = dict(renderers)
+    media_types = tuple(renderers)
+    fallback = next(iter(renderers.items()), None)
+
+    if force and len(renderers) == 1:
+        # Every Accept header resolves to the only renderer; skip parsing entirely
+        def select_only(request: web.Request):
+            return fallback
+        return select_only
+
+    # Selection for clients that accept anything, which is what most clients send
+    any_match = _best_match('*/*', media_types)
+    accept_any = (any_match, renderers[any_match]) if any_match else fallback
+    # Maps Accept headers to selected (media type, renderer) pairs
+    selected = {}
+
+    def selector(request: web.Request):
+        header = request.headers.get(hdrs.ACCEPT)
+        if header is None or header == '*/*':
+            return accept_any
+        result = selected.get(header)
+        if result is not None:
+            return result
+        best_match = _best_match(header, media_types)
+        if not best_match:
+            if force:
+                result = fallback
+            else:
+                raise web.HTTPNotAcceptable
+        else:
+            result = best_match, renderers[best_match]
+        if len(selected) >= _SELECTOR_CACHE_SIZE:
+            # Evict the oldest entry
+            selected.pop(next(iter(selected)), None)
+        selected[header] = result
+        return result
+    return selector
+
+
 # ###### Renderers ######
 
+def _dump_json(json_module, data, default=None) -> bytes:
+    # Check the name so orjson isn't imported unless a renderer is configured to use it
+    if getattr(json_module, '__name__', None) == 'orjson':
+        # orjson returns bytes, so there is no str to encode.
+        # Allow non-str keys for parity with the json module.
+        return json_module.dumps(data, default=default, option=json_module.OPT_NON_STR_KEYS)
+    if default is not None:
+        return json_module.dumps(data, default=default).encode('utf-8')
+    return json_module.dumps(data).encode('utf-8')
+
+
 # Use a class so that json module is easily override-able
 class JSONRenderer:
-    """Callable object which renders to JSON."""
+    """Callable object which renders to JSON using the standard library's `json` module.
+
+    To render with `orjson` instead, set ``json_module`` on a subclass. ::
+
+        import orjson
+
+        class ORJSONRenderer(JSONRenderer):
+            json_module = orjson
+
+    Note that orjson's output differs from the `json` module's: it omits whitespace,
+    raises `TypeError` for integers outside the 64-bit range and
+    renders ``NaN`` and ``Infinity`` as ``null``.
+
+    :param default: Function that gets called for objects that can't otherwise
+        be serialized, e.g. `datetime.datetime` or `decimal.Decimal`. It should
+        return a serializable version of the object or raise a `TypeError`.
+    """
     json_module = pyjson
 
+    def __init__(self, default: callable = None):
+        self.default = default
+
     def __repr__(self):
+        if self.default is not None:
+            return '<JSONRenderer(default={!r})>'.format(self.default)
         return '<JSONRenderer()>'
 
     def __call__(self, request, data):
-        return self.json_module.dumps(data).encode('utf-8')
+        return _dump_json(self.json_module, data, self.default)
 
 
 #: Render data to JSON. Singleton `JSONRenderer`. This can be passed to the
@@ -185,11 +285,12 @@ render_json = JSONRenderer()
 #: Default configuration
 DEFAULTS = {
     'NEGOTIATOR': select_renderer,
-    'RENDERERS': OrderedDict([
-        ('application/json', render_json),
-    ]),
+    'RENDERERS': {
+        'application/json': render_json,
+    },
     'FORCE_NEGOTIATION': True,
     'FORCE_RENDERING': False,
+    'ASYNC_RENDER_THRESHOLD': None,
 }
 
 
@@ -197,37 +298,59 @@ def negotiation_middleware(
     renderers=DEFAULTS['RENDERERS'],
     negotiator=DEFAULTS['NEGOTIATOR'],
     force_negotiation=DEFAULTS['FORCE_NEGOTIATION'],
-    force_rendering=DEFAULTS['FORCE_RENDERING']
+    force_rendering=DEFAULTS['FORCE_RENDERING'],
+    async_render_threshold=DEFAULTS['ASYNC_RENDER_THRESHOLD']
 ):
     """Middleware which selects a renderer for a given request then renders
     a handler's data to a `aiohttp.web.Response`.
     """
+    if negotiator is select_renderer:
+        negotiate = _make_renderer_selector(renderers, force_negotiation)
+    else:
+        def negotiate(request):
+            return negotiator(request, renderers, force_negotiation)
+
+    # Inspect each renderer once instead of on every request
+    coroutine_renderers = {
+        media_type: (renderer, asyncio.iscoroutinefunction(renderer))
+        for media_type, renderer in renderers.items()
+    }
+
     async def factory(app, handler):
         async def middleware(request):
-            content_type, renderer = negotiator(
-                request,
-                renderers,
-                force_negotiation,
-            )
+            content_type, renderer = negotiate(request)
             request['selected_media_type'] = content_type
             response = await handler(request)
 
-            data = getattr(response, 'data', None)
-            if isinstance(response, Response) and (force_rendering or data):
-                # Render data with the selected renderer
-                if asyncio.iscoroutinefunction(renderer):
-                    render_result = await renderer(request, data)
-                else:
-                    render_result = renderer(request, data)
+            # Only negotiation Responses carry data to render
+            if not isinstance(response, Response):
+                return response
+            data = response.data
+            if not (force_rendering or data):
+                return response
+
+            # Render data with the selected renderer
+            known_renderer, is_coroutine = coroutine_renderers.get(content_type, (None, None))
+            if known_renderer is not renderer:
+                # Negotiator returned a renderer that isn't in ``renderers``
+                is_coroutine = asyncio.iscoroutinefunction(renderer)
+            if is_coroutine:
+                render_result = await renderer(request, data)
+            elif (async_render_threshold is not None and
+                    isinstance(data, Sized) and len(data) > async_render_threshold):
+                loop = asyncio.get_running_loop()
+                render_result = await loop.run_in_executor(None, renderer, request, data)
             else:
-                render_result = response
+                render_result = renderer(request, data)
             if isinstance(render_result, web.Response):
                 return render_result
 
-            if force_rendering or data is not None:
-                response.body = render_result
+            response.body = render_result
+            if hdrs.CONTENT_TYPE in response.headers:
+                # Go through the setter to keep parameters such as charset
                 response.content_type = content_type
-
+            else:
+                response.headers[hdrs.CONTENT_TYPE] = content_type
             return response
         return middleware
     return factory
@@ -235,9 +358,10 @@ def negotiation_middleware(
 
 def setup(
         app: web.Application, *, negotiator: callable = DEFAULTS['NEGOTIATOR'],
-        renderers: OrderedDict = DEFAULTS['RENDERERS'],
+        renderers: Mapping = DEFAULTS['RENDERERS'],
         force_negotiation: bool = DEFAULTS['FORCE_NEGOTIATION'],
-        force_rendering: bool = DEFAULTS['FORCE_RENDERING']):
+        force_rendering: bool = DEFAULTS['FORCE_RENDERING'],
+        async_render_threshold: int = DEFAULTS['ASYNC_RENDER_THRESHOLD']):
     """Set up the negotiation middleware. Reads configuration from
     ``app['AIOHTTP_UTILS']``.
 
@@ -250,13 +374,16 @@ def setup(
         client passes an unsupported media type).
     :param force_rendering: Whether to enforce rendering the result even if it
         considered False.
+    :param async_render_threshold: Render data in an executor if its length
+        exceeds this value. If `None`, always render in the event loop.
     """
     config = app.get(CONFIG_KEY, {})
     middleware = negotiation_middleware(
         renderers=config.get('RENDERERS', renderers),
         negotiator=config.get('NEGOTIATOR', negotiator),
         force_negotiation=config.get('FORCE_NEGOTIATION', force_negotiation),
-        force_rendering=config.get('FORCE_RENDERING', force_rendering)
+        force_rendering=config.get('FORCE_RENDERING', force_rendering),
+        async_render_threshold=config.get('ASYNC_RENDER_THRESHOLD', async_render_threshold)
     )
     app.middlewares.append(middleware)
     return app
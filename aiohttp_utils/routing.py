@@ -2,8 +2,10 @@
 from collections.abc import Mapping
 from contextlib import contextmanager
 import importlib
+import sys
 
 from aiohttp import web
+from aiohttp.web_urldispatcher import MatchInfoError
 
 __all__ = (
     'ResourceRouter',
@@ -54,9 +56,58 @@ class ResourceRouter(web.UrlDispatcher):
     """
 
     HTTP_METHOD_NAMES = ['get', 'post', 'put', 'patch', 'delete', 'head', 'options', 'trace']
+    # HTTP methods for the standard method names, so they aren't uppercased for every route
+    _UPPER_METHOD_NAMES = {
+        method_name: sys.intern(method_name.upper()) for method_name in HTTP_METHOD_NAMES
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Built on freeze: maps each static path to the resources that could match it
+        self._plain_index = None
+        self._unindexed_resources = ()
+
+    def freeze(self):
+        super().freeze()
+        # Newer aiohttp versions index resources themselves
+        if hasattr(self, '_resource_index'):
+            return
+        plain_index = {}
+        unindexed = []
+        for resource in self._resources:
+            # Subclasses of PlainResource may match differently, so only index the exact type
+            if type(resource) is web.PlainResource:
+                path = resource.canonical
+                if path not in plain_index:
+                    plain_index[path] = list(unindexed)
+                plain_index[path].append(resource)
+            else:
+                unindexed.append(resource)
+                for candidates in plain_index.values():
+                    candidates.append(resource)
+        self._plain_index = plain_index
+        self._unindexed_resources = tuple(unindexed)
+
+    async def resolve(self, request):
+        """Resolve a request like `aiohttp.web.UrlDispatcher`, but only try the resources
+        that can match its path, in registration order. Static paths are looked up in
+        an index built when the router is frozen.
+        """
+        if self._plain_index is None:
+            return await super().resolve(request)
+        resources = self._plain_index.get(request.rel_url.raw_path, self._unindexed_resources)
+        allowed_methods = set()
+        for resource in resources:
+            match_dict, allowed = await resource.resolve(request)
+            if match_dict is not None:
+                return match_dict
+            allowed_methods |= allowed
+        if allowed_methods:
+            return MatchInfoError(web.HTTPMethodNotAllowed(request.method, allowed_methods))
+        return MatchInfoError(web.HTTPNotFound())
 
     def get_default_handler_name(self, resource, method_name: str):
-        return '{resource.__class__.__name__}:{method_name}'.format(**locals())
+        return f'{type(resource).__name__}:{method_name}'
 
     def add_resource_object(self, path: str, resource,
                             methods: tuple = tuple(), names: Mapping = None):
@@ -75,16 +126,37 @@ class ResourceRouter(web.UrlDispatcher):
         for method_name in method_names:
             handler = getattr(resource, method_name, None)
             if handler:
-                name = names.get(method_name, self.get_default_handler_name(resource, method_name))
-                self.add_route(method_name.upper(), path, handler, name=name)
+                name = names.get(method_name)
+                if name is None:
+                    name = self.get_default_handler_name(resource, method_name)
+                method = self._UPPER_METHOD_NAMES.get(method_name) or method_name.upper()
+                self.add_route(method, path, handler, name=name)
+
+
+def _import_module(name: str):
+    """Import a module by name, returning it straight from `sys.modules` if it
+    has already been imported.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
 
 
 def make_path(path, url_prefix=None):
-    return ('/'.join((url_prefix.rstrip('/'), path.lstrip('/')))
+    return (url_prefix.rstrip('/') + '/' + path.lstrip('/')
             if url_prefix
             else path)
 
 
+def _make_path_prefixer(url_prefix=None):
+    # Same as make_path with a fixed url_prefix, but the prefix is only normalized once
+    if not url_prefix:
+        return lambda path: path
+    base = url_prefix.rstrip('/') + '/'
+    return lambda path: base + path.lstrip('/')
+
+
 @contextmanager
 def add_route_context(
     app: web.Application, module=None,
@@ -128,7 +200,8 @@ def add_route_context(
     :param name_prefix: Prefix to prepend to all route names.
     """
     if isinstance(module, (str, bytes)):
-        module = importlib.import_module(module)
+        module = _import_module(module)
+    prefix_path = _make_path_prefixer(url_prefix)
 
     def add_route(method, path, handler, name=None):
         """
@@ -148,7 +221,7 @@ def add_route_context(
             handler = getattr(module, handler)
         else:
             name = name or handler.__name__
-        path = make_path(path, url_prefix)
+        path = prefix_path(path)
         name = '.'.join((name_prefix, name)) if name_prefix else name
         return app.router.add_route(method, path, handler, name=name)
     yield add_route
@@ -236,13 +309,11 @@ def add_resource_context(
     assert isinstance(app.router, ResourceRouter), 'app must be using ResourceRouter'
 
     if isinstance(module, (str, bytes)):
-        module = importlib.import_module(module)
-
-    def get_base_name(resource, method_name, names):
-        return names.get(method_name,
-                         app.router.get_default_handler_name(resource, method_name))
+        module = _import_module(module)
 
     default_make_resource = make_resource
+    prefix_path = _make_path_prefixer(url_prefix)
+    prefix = name_prefix + '.' if name_prefix else ''
 
     def add_route(path: str, resource,
                   names: Mapping = None, make_resource=None):
@@ -255,14 +326,22 @@ def add_resource_context(
                 )
             resource_cls = getattr(module, resource)
             resource = make_resource(resource_cls)
-        path = make_path(path, url_prefix)
+        path = prefix_path(path)
         if name_prefix:
-            supported_method_names = get_supported_method_names(resource)
-            names = {
-                method_name: '.'.join(
-                    (name_prefix, get_base_name(resource, method_name, names=names))
-                )
-                for method_name in supported_method_names
-            }
+            # Find the supported methods and build their names in a single pass
+            prefixed_names = {}
+            for method_name in app.router.HTTP_METHOD_NAMES:
+                if not hasattr(resource, method_name):
+                    continue
+                base_name = names.get(method_name)
+                if base_name is None:
+                    base_name = app.router.get_default_handler_name(resource, method_name)
+                prefixed_names[method_name] = prefix + base_name
+            # The resource's methods are already known; don't look them all up again
+            return app.router.add_resource_object(
+                path, resource, methods=tuple(prefixed_names), names=prefixed_names
+            )
+        if not names:
+            return app.router.add_resource_object(path, resource)
         return app.router.add_resource_object(path, resource, names=names)
     yield add_route
@@ -82,7 +82,7 @@ class Runner:
 
     @property
     def bind(self):
-        return '{self.host}:{self.port}'.format(self=self)
+        return f'{self.host}:{self.port}'
 
     def make_gunicorn_app(self):
         gapp = GunicornApp(self.app, app_uri=self.app_uri)
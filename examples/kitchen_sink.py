@@ -21,6 +21,21 @@ Try it out:
 from aiohttp import web
 from aiohttp_utils import Response, routing, negotiation
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(negotiation.JSONRenderer):
+    """Render JSON with orjson, which is faster than the standard library's json module."""
+    json_module = orjson
+
+
+# Use orjson if it is installed (pip install aiohttp-utils[orjson])
+render_json = ORJSONRenderer() if orjson else negotiation.render_json
+
+
 app = web.Application(router=routing.ResourceRouter())
 
 
@@ -42,4 +57,6 @@ with routing.add_route_context(app) as route:
 with routing.add_resource_context(app, url_prefix='/api/') as route:
     route('/', HelloResource())
 
-negotiation.setup(app)
+negotiation.setup(app, renderers={
+    'application/json': render_json,
+})
@@ -13,18 +13,22 @@ Try it out:
     $ http :8000/ Accept:application/json
     $ http :8000/ Accept:text/html
 """
-from collections import OrderedDict
 from collections.abc import Mapping
 
 from aiohttp import web
-from aiohttp_utils import Response, negotiation
+from aiohttp_utils import Response, negotiation, routing
 
 from mako.lookup import TemplateLookup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ##### Templates #####
 
-lookup = TemplateLookup()
+lookup = TemplateLookup(filesystem_checks=False, output_encoding='utf-8')
 # Note: In a real app, this would be in a separate file.
 template = """
 <html>
@@ -39,53 +43,68 @@ lookup.put_string('index.html', template)
 # ##### Handlers #####
 
 async def index(request):
+    name = request.query.get('name', 'World')
     return Response({
-        'message': 'Hello ' + request.query.get('name', 'World')
+        'message': f'Hello {name}'
     })
 
 
 # ##### Custom router #####
 
-class RouterWithTemplating(web.UrlDispatcher):
-    """Optionally save a template name on a handler function's __dict__."""
+class RouterWithTemplating(routing.ResourceRouter):
+    """Optionally save a template on a handler function's __dict__.
+    The template is looked up once, when the route is added, rather than on every request.
+    """
+
+    def __init__(self, lookup: TemplateLookup):
+        super().__init__()
+        self.lookup = lookup
 
     def add_route(self, method, path, handler, template: str = None, **kwargs):
         if template:
-            handler.__dict__['template'] = template
+            handler.__dict__['template'] = self.lookup.get_template(template)
         super().add_route(method, path, handler, **kwargs)
 
 
-# ##### Renderer #####
+# ##### Renderers #####
+
+class ORJSONRenderer(negotiation.JSONRenderer):
+    """Render JSON with orjson, which is faster than the standard library's json module."""
+    json_module = orjson
+
+
+# Use orjson if it is installed (pip install aiohttp-utils[orjson])
+render_json = ORJSONRenderer() if orjson else negotiation.render_json
+
 
 def render_mako(request, data):
     handler = request.match_info.handler
-    template_name = handler.__dict__.get('template', None)
-    if not template_name:
+    template = handler.__dict__.get('template', None)
+    if not template:
         raise web.HTTPNotAcceptable(text='text/html not supported.')
     if not isinstance(data, Mapping):
         raise web.HTTPInternalServerError(
             text="context should be mapping, not {}".format(type(data)))
-    template = request.app['mako_lookup'].get_template(template_name)
-    text = template.render_unicode(**data)
-    return web.Response(text=text, content_type=request['selected_media_type'])
+    # The lookup has an output_encoding, so this renders straight to UTF-8 bytes
+    body = template.render(**data)
+    return web.Response(body=body, content_type='text/html', charset='utf-8')
 
 
 # ##### Configuration #####
 
 CONFIG = {
     'AIOHTTP_UTILS': {
-        'RENDERERS': OrderedDict([
-            ('application/json', negotiation.render_json),
-            ('text/html', render_mako),
-        ])
+        'RENDERERS': {
+            'application/json': render_json,
+            'text/html': render_mako,
+        }
     }
 }
 
 
 # ##### Application #####
 
-app = web.Application(router=RouterWithTemplating(), debug=True)
-app['mako_lookup'] = lookup
+app = web.Application(router=RouterWithTemplating(lookup), debug=True)
 app.update(CONFIG)
 negotiation.setup(app)
 app.router.add_route('GET', '/', index, template='index.html')
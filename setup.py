@@ -13,14 +13,9 @@ def find_version(fname):
     """Attempts to find the version number in the file names fname.
     Raises RuntimeError if not found.
     """
-    version = ''
     with open(fname, 'r') as fp:
-        reg = re.compile(r'__version__ = [\'"]([^\'"]*)[\'"]')
-        for line in fp:
-            m = reg.match(line)
-            if m:
-                version = m.group(1)
-                break
+        m = re.search(r'^__version__ = [\'"]([^\'"]*)[\'"]', fp.read(), re.M)
+    version = m.group(1) if m else ''
     if not version:
         raise RuntimeError('Cannot find version information')
     return version
@@ -46,6 +41,8 @@ setup(
     package_dir={'aiohttp-utils': 'aiohttp_utils'},
     include_package_data=True,
     install_requires=REQUIRES,
+    python_requires='>=3.7',
+    extras_require={'orjson': ['orjson']},
     license='MIT',
     zip_safe=False,
     keywords='aiohttp_utils aiohttp utilities aiohttp.web',
@@ -55,8 +52,6 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
     ],
     test_suite='tests'
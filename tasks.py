@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+import subprocess
 import sys
 import webbrowser
 
@@ -11,19 +12,29 @@ build_dir = os.path.join(docs_dir, '_build')
 
 @task
 def test(ctx, watch=False, last_failing=False):
-    """Run the tests.
+    """Run the tests. flake8 runs in the background while the tests run.
 
     Note: --watch requires pytest-xdist to be installed.
     """
     import pytest
-    flake(ctx)
     args = []
     if watch:
         args.append('-f')
     if last_failing:
         args.append('--lf')
+    # Run flake8 as a separate process that can't touch the terminal, so it
+    # doesn't compete with pytest for stdin (e.g. with --pdb or --watch)
+    flake_proc = subprocess.Popen(
+        [sys.executable, '-m', 'flake8', '.'], stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+    )
     retcode = pytest.main(args)
-    sys.exit(retcode)
+    flake_out, flake_err = flake_proc.communicate()
+    # Report flake8 after the test output so the two don't interleave
+    print('flake8 .')
+    print(flake_out, end='')
+    print(flake_err, end='', file=sys.stderr)
+    sys.exit(retcode or flake_proc.returncode)
 
 
 @task
@@ -1,6 +1,17 @@
+from decimal import Decimal
+import json
+import subprocess
+import sys
+import threading
+
 import pytest
 from collections import OrderedDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from aiohttp import web
 
 from aiohttp_utils import negotiation, CONFIG_KEY
@@ -90,9 +101,9 @@ def dummy_renderer(request, data):
 
 def test_renderer_override(app, client):
     configure_app(app, overrides={
-        'renderers': OrderedDict([
-            ('text/html', dummy_renderer),
-        ])
+        'renderers': {
+            'text/html': dummy_renderer,
+        }
     }, setup=True)
 
     res = client.get('/hello')
@@ -102,11 +113,11 @@ def test_renderer_override(app, client):
 
 def test_renderer_override_multiple_classes(app, client):
     configure_app(app, overrides={
-        'renderers': OrderedDict([
-            ('text/html', dummy_renderer),
-            ('application/json', negotiation.render_json),
-            ('application/vnd.api+json', negotiation.render_json),
-        ])
+        'renderers': {
+            'text/html': dummy_renderer,
+            'application/json': negotiation.render_json,
+            'application/vnd.api+json': negotiation.render_json,
+        }
     }, setup=True)
 
     res = client.get('/hello', headers={'Accept': 'application/json'})
@@ -145,6 +156,104 @@ def test_renderer_override_force_rendering(app, client):
     assert res.content_type == 'application/json'
     assert res.json is None
 
+    # plain aiohttp responses are left untouched
+    res = client.get('/nonego')
+    assert res.content_type == 'application/octet-stream'
+    assert res.body == b'Some raw data'
+
+
+def test_accept_any(app, client):
+    configure_app(app, overrides={
+        'renderers': {
+            'text/html': dummy_renderer,
+            'application/json': negotiation.render_json,
+        }
+    }, setup=True)
+
+    # Ties go to the last renderer, as with mimeparse.best_match
+    res = client.get('/hello')
+    assert res.content_type == 'application/json'
+    res = client.get('/hello', headers={'Accept': '*/*'})
+    assert res.content_type == 'application/json'
+
+
+def test_selection_cache_eviction(app, client, monkeypatch):
+    monkeypatch.setattr(negotiation, '_SELECTOR_CACHE_SIZE', 2)
+    configure_app(app, overrides={
+        'renderers': {
+            'text/html': dummy_renderer,
+            'application/json': negotiation.render_json,
+        }
+    }, setup=True)
+
+    expected = {
+        'application/json': 'application/json',
+        'text/html': 'text/html',
+        'text/html;q=0.5,application/json': 'application/json',
+    }
+    for _ in range(2):
+        for accept, content_type in expected.items():
+            res = client.get('/hello', headers={'Accept': accept})
+            assert res.content_type == content_type
+
+
+def test_custom_negotiator(app, client):
+    def negotiator(request, renderers, force):
+        return 'text/html', renderers['text/html']
+
+    configure_app(app, overrides={
+        'negotiator': negotiator,
+        'renderers': {
+            'application/json': negotiation.render_json,
+            'text/html': dummy_renderer,
+        }
+    }, setup=True)
+
+    res = client.get('/hello', headers={'Accept': 'application/json'})
+    assert res.content_type == 'text/html'
+    assert res.body == b'<p>Hello world</p>'
+
+
+def test_coroutine_renderer(app, client):
+    async def render_text(request, data):
+        return data['message'].encode('utf-8')
+
+    configure_app(app, overrides={
+        'renderers': {
+            'text/plain': render_text,
+            'application/json': negotiation.render_json,
+        }
+    }, setup=True)
+
+    res = client.get('/hello', headers={'Accept': 'text/plain'})
+    assert res.content_type == 'text/plain'
+    assert res.body == b'Hello world'
+
+    res = client.get('/hello', headers={'Accept': 'application/json'})
+    assert res.json == {'message': 'Hello world'}
+
+
+@pytest.mark.parametrize('threshold,in_executor', [
+    (None, False),
+    (1, False),
+    (0, True),
+])
+def test_async_render_threshold(app, client, threshold, in_executor):
+    render_threads = []
+
+    def recording_renderer(request, data):
+        render_threads.append(threading.current_thread())
+        return negotiation.render_json(request, data)
+
+    configure_app(app, overrides={
+        'renderers': {'application/json': recording_renderer},
+        'async_render_threshold': threshold,
+    }, setup=True)
+
+    res = client.get('/hello')
+    assert res.json == {'message': 'Hello world'}
+    assert (render_threads[0] is not threading.current_thread()) is in_executor
+
 
 def test_nonordered_dict_of_renderers(app, client):
     configure_app(app, overrides={
@@ -160,6 +269,7 @@ def test_nonordered_dict_of_renderers(app, client):
 def test_configuration_through_app_key(app, client):
     add_routes(app)
     app[CONFIG_KEY] = {
+        # Any ordered mapping works, not just dicts
         'RENDERERS': OrderedDict([
             ('text/html', dummy_renderer),
         ])
@@ -181,3 +291,69 @@ def test_renderer_no_nego(app, client):
     res = client.get('/nonego', headers={'Accept': 'application/json'})
     assert res.content_type == 'application/octet-stream'
     assert res.body == b'Some raw data'
+
+
+def test_same_accept_header_with_different_renderers(create_client, loop):
+    html_app = web.Application(loop=loop)
+    configure_app(html_app, overrides={
+        'renderers': {
+            'application/json': negotiation.render_json,
+            'text/html': dummy_renderer,
+        }
+    }, setup=True)
+    json_app = web.Application(loop=loop)
+    configure_app(json_app, setup=True)
+
+    headers = {'Accept': 'text/html,application/json;q=0.9'}
+    for _ in range(2):
+        res = create_client(html_app).get('/hello', headers=headers)
+        assert res.content_type == 'text/html'
+
+        res = create_client(json_app).get('/hello', headers=headers)
+        assert res.content_type == 'application/json'
+
+
+class TestJSONRenderer:
+
+    def test_renders_to_bytes(self):
+        rendered = negotiation.render_json(None, {'message': 'Hello world', 1: [1.5, None]})
+        assert isinstance(rendered, bytes)
+        assert json.loads(rendered.decode('utf-8')) == {'message': 'Hello world', '1': [1.5, None]}
+
+    @pytest.mark.parametrize('data', [None, True, 1, 1.0, 'Hello world'])
+    def test_renders_scalars(self, data):
+        rendered = negotiation.render_json(None, data)
+        assert json.loads(rendered.decode('utf-8')) == data
+        assert type(json.loads(rendered.decode('utf-8'))) is type(data)
+
+    @pytest.mark.skipif(orjson is None, reason='orjson is not installed')
+    def test_does_not_import_orjson(self):
+        code = ('import sys, aiohttp_utils.negotiation; '
+                'assert "orjson" not in sys.modules')
+        subprocess.check_call([sys.executable, '-c', code])
+
+    def test_uses_stdlib_json_by_default(self):
+        assert negotiation.JSONRenderer.json_module is json
+        rendered = negotiation.render_json(None, {'big': 2 ** 70, 'nan': float('nan')})
+        assert rendered == b'{"big": 1180591620717411303424, "nan": NaN}'
+
+    @pytest.mark.parametrize('json_module', [
+        json,
+        pytest.param(orjson, marks=pytest.mark.skipif(orjson is None,
+                                                      reason='orjson is not installed')),
+    ])
+    def test_default(self, json_module):
+        class Renderer(negotiation.JSONRenderer):
+            pass
+        Renderer.json_module = json_module
+
+        render = Renderer(default=str)
+        rendered = render(None, {'price': Decimal('9.99')})
+        assert json.loads(rendered.decode('utf-8')) == {'price': '9.99'}
+
+    def test_json_module_override(self):
+        class StdlibJSONRenderer(negotiation.JSONRenderer):
+            json_module = json
+
+        rendered = StdlibJSONRenderer()(None, {'message': 'Hello world'})
+        assert rendered == b'{"message": "Hello world"}'
@@ -76,6 +76,31 @@ class TestResourceRouter:
         res = client.post('/child', expect_errors=True)
         assert res.status_code == 405
 
+    def test_resolves_routes_in_registration_order(self, app, client):
+        async def dynamic(request):
+            return web.Response(body=b'dynamic', content_type='text/plain')
+
+        async def static(request):
+            return web.Response(body=b'static', content_type='text/plain')
+
+        app.router.add_route('GET', '/before', static)
+        app.router.add_route('GET', '/{name}', dynamic)
+        app.router.add_route('GET', '/after', static)
+
+        assert client.get('/before').text == 'static'
+        assert client.get('/after').text == 'dynamic'
+        assert client.get('/other').text == 'dynamic'
+
+    def test_unmatched_routes(self, app, client):
+        configure_app(app)
+
+        res = client.put('/my', expect_errors=True)
+        assert res.status_code == 405
+        assert set(res.headers['Allow'].split(',')) == {'GET', 'POST'}
+
+        res = client.get('/missing', expect_errors=True)
+        assert res.status_code == 404
+
 
 class TestAddRouteContext:
 
@@ -128,6 +153,14 @@ class TestAddRouteContext:
         assert str(app.router['index'].url_for()) == '/api/'
         assert str(app.router['list_projects'].url_for()) == '/api/projects/'
 
+    def test_add_route_context_with_url_prefix_without_trailing_slash(self, app):
+        with add_route_context(app, views, url_prefix='/api') as route:
+            route('GET', '/', 'index')
+            route('GET', 'projects/', 'list_projects')
+
+        assert str(app.router['index'].url_for()) == '/api/'
+        assert str(app.router['list_projects'].url_for()) == '/api/projects/'
+
     def test_add_route_context_with_name_prefix(self, app):
         with add_route_context(app, views, name_prefix='api') as route:
             route('GET', '/', 'index')
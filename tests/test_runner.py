@@ -1,8 +1,30 @@
+import subprocess
+import sys
+
 import pytest
 from aiohttp import web
+import aiohttp_utils
+from aiohttp_utils import runner
 from aiohttp_utils.runner import Runner
 
 
+def test_importing_package_does_not_import_runner():
+    code = ('import sys, aiohttp_utils; '
+            'assert "aiohttp_utils.runner" not in sys.modules; '
+            'assert "gunicorn.app.wsgiapp" not in sys.modules')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
+def test_run_is_importable_from_package():
+    assert aiohttp_utils.run is runner.run
+
+
+def test_runner_module_is_accessible_from_package():
+    code = ('import aiohttp_utils; '
+            'assert aiohttp_utils.runner.Runner is not None')
+    subprocess.check_call([sys.executable, '-c', code])
+
+
 class TestRunner:
 
     def test_bind(self):
@@ -28,3 +50,10 @@ class TestRunner:
 
         app = web.Application(debug=False)
         assert Runner(app, reload=True, app_uri='foo').reload is True
+
+    def test_worker_class_can_be_overridden_per_instance(self):
+        app = web.Application()
+        runner = Runner(app, reload=False)
+        runner.worker_class = 'aiohttp.GunicornUVLoopWebWorker'
+        assert runner.worker_class == 'aiohttp.GunicornUVLoopWebWorker'
+        assert Runner.worker_class == 'aiohttp_utils.runner.GunicornWorker'
@@ -1,41 +1,44 @@
 """Handlers for testing routing"""
-from aiohttp import web
+from aiohttp.web import Response
 
 
 async def index(request):
-    return web.Response()
+    return Response()
 
 
 async def list_projects(request):
-    return web.Response()
+    return Response()
 
 
 async def create_projects(request):
-    return web.Response()
+    return Response()
 
 
 class ArticleResource:
+    __slots__ = ()
 
     async def get(self, request):
-        return web.Response()
+        return Response()
 
     async def post(self, request):
-        return web.Response()
+        return Response()
 
 
 class ArticleList:
+    __slots__ = ()
 
     async def get(self, request):
-        return web.Response()
+        return Response()
 
     async def post(self, request):
-        return web.Response()
+        return Response()
 
 
 class AuthorList:
+    __slots__ = ('db', )
 
     def __init__(self, db):
         self.db = db
 
     async def get(self, request):
-        return web.Response()
+        return Response()